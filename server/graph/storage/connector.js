@@ -110,6 +110,8 @@ class PwConnector {
             uri: url,
             json: true,
             gzip: true,
+            // reuse sockets across calls to skip repeated TCP/TLS setup
+            forever: true,
             headers: {
                 'user-agent': 'psy-bf'
             },
@@ -62,6 +62,7 @@ class AbstractGenerator {
 
 const cdnURL = constants.get('cdn');
 const thumbSize = constants.get('thumbSize');
+const semanticFetchConcurrency = constants.get('semanticFetchConcurrency');
 
 const buildImage = fileName => {
     const fileNameHash = crypto.createHash('md5')
@@ -155,16 +156,18 @@ class Substances {
 
         const self = this;
 
-        return yield Promise.all(
-            this._mapTextUrl(results).map(item =>
+        /* bound the fan-out so large result sets don't flood the wiki */
+        return yield Promise.map(
+            this._mapTextUrl(results),
+            item =>
                 Promise.coroutine(function* (_item) {
                     const semanticData = yield* self.getSemanticSubstanceProps(_item.name);
 
                     process.env.DUMP_SEMANTICS && this._log.trace('Processed semantic data', semanticData);
 
                     return _.merge(item, semanticData);
-                }).call(this, item)
-            )
+                }).call(this, item),
+            {concurrency: semanticFetchConcurrency}
         );
     }
 
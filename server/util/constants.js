@@ -2,5 +2,6 @@
 
 module.exports = new Map([
     ['cdn', 'https://psychonautwiki.org/'],
-    ['thumbSize', 100]
+    ['thumbSize', 100],
+    ['semanticFetchConcurrency', 8]
 ]);